@@ -2,10 +2,25 @@
 Warp Mining AI Configuration
 """
 
+import functools
 import os
+import types
 from dataclasses import dataclass
 
-@dataclass
+# Directories already verified/created this process, so repeated WarpConfig
+# construction doesn't re-issue the same filesystem syscalls.
+_ENSURED_DIRS = set()
+
+def _ensure_dir(path: str):
+    """Create a directory once per process, tolerating filesystem errors"""
+    if path not in _ENSURED_DIRS:
+        try:
+            os.makedirs(path, exist_ok=True)
+        except OSError:
+            pass
+        _ENSURED_DIRS.add(path)
+
+@dataclass(frozen=True)
 class WarpConfig:
     """Configuration settings for Warp Mining AI Assistant"""
     
@@ -21,55 +36,71 @@ class WarpConfig:
     # Mining simulation parameters
     SIMULATION_PRECISION: int = 4
     MAX_SIMULATION_TIME: int = 300  # seconds
+
+    # Generate the synthetic training dataset on every extraction
+    # simulation. Nothing consumes it beyond its row count, so it is off
+    # by default and kept only for inspection/debugging runs.
+    GENERATE_SYNTHETIC_DATA: bool = False
     
     # Optimization settings
     OPTIMIZATION_ITERATIONS: int = 100
     CONVERGENCE_THRESHOLD: float = 1e-6
+
+    # Maximum retained engine history records per simulator
+    HISTORY_MAX: int = 1024
+
+    # Run one small pass of each engine at startup so the first real
+    # request doesn't pay cold-start costs (disable for fast test startup)
+    WARMUP: bool = True
+
+    # SocketIO message queue URL (e.g. 'redis://redis:6379/0') for
+    # fanning events out across gunicorn workers; empty means single-worker
+    SOCKETIO_MESSAGE_QUEUE: str = ''
     
     # Data storage paths
     DATA_DIR: str = '/app/data'
     SIMULATION_DIR: str = '/app/simulations'
     KNOWLEDGE_DIR: str = '/app/knowledge'
     
-    # Mining knowledge parameters
-    COPPER_EXTRACTION_METHODS = [
+    # Mining knowledge parameters (tuples: shared across instances, immutable)
+    COPPER_EXTRACTION_METHODS = (
         'sulfuric_acid_leaching',
         'heap_leaching',
         'solvent_extraction_electrowinning',
         'pyrometallurgy',
         'bioleaching'
-    ]
+    )
     
-    COBALT_REFINING_METHODS = [
+    COBALT_REFINING_METHODS = (
         'hydrometallurgical_processing',
         'precipitation_separation',
         'solvent_extraction',
         'electrorefining',
         'selective_precipitation'
-    ]
+    )
     
-    GEOLOGICAL_INDICATORS = [
+    GEOLOGICAL_INDICATORS = (
         'alteration_zones',
         'geochemical_anomalies',
         'structural_controls',
         'lithological_contacts',
         'hydrothermal_systems'
-    ]
+    )
     
     # Chemical equations and constants
-    COPPER_CHEMISTRY = {
+    COPPER_CHEMISTRY = types.MappingProxyType({
         'oxide_leaching': 'CuO + H2SO4 → CuSO4 + H2O',
         'sulfide_oxidation': '2CuFeS2 + 4H2SO4 + O2 → 2CuSO4 + Fe2(SO4)3 + 2S + 4H2O',
         'electrowinning': 'CuSO4 + H2O → Cu + H2SO4 + ½O2',
         'solvent_extraction': 'CuSO4 + 2RH → R2Cu + H2SO4'
-    }
+    })
     
-    COBALT_CHEMISTRY = {
+    COBALT_CHEMISTRY = types.MappingProxyType({
         'sulfide_roasting': '2CoS + 3O2 → 2CoO + 2SO2',
         'acid_leaching': 'CoO + H2SO4 → CoSO4 + H2O',
         'precipitation': 'CoSO4 + Na2S → CoS + Na2SO4',
         'electrowinning': 'Co²⁺ + 2e⁻ → Co'
-    }
+    })
     
     # ML Model parameters
     ML_MODELS = {
@@ -91,16 +122,27 @@ class WarpConfig:
         }
     }
     
-    def __post_init__(self):
-        """Initialize derived configurations"""
-        # Override with environment variables if available
-        self.HOST = os.getenv('WARP_HOST', self.HOST)
-        self.PORT = int(os.getenv('WARP_PORT', self.PORT))
-        self.DEBUG = os.getenv('WARP_DEBUG', 'false').lower() == 'true'
-        self.OLLAMA_BASE_URL = os.getenv('OLLAMA_BASE_URL', self.OLLAMA_BASE_URL)
-        self.OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', self.OLLAMA_MODEL)
-        
-        # Create directories if they don't exist
-        os.makedirs(self.DATA_DIR, exist_ok=True)
-        os.makedirs(self.SIMULATION_DIR, exist_ok=True)
-        os.makedirs(self.KNOWLEDGE_DIR, exist_ok=True)
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> WarpConfig:
+    """Return the process-wide configuration singleton.
+
+    Environment variables are read and storage directories created exactly
+    once per process; every engine shares the same frozen instance.
+    """
+    config = WarpConfig(
+        HOST=os.getenv('WARP_HOST', WarpConfig.HOST),
+        PORT=int(os.getenv('WARP_PORT', WarpConfig.PORT)),
+        DEBUG=os.getenv('WARP_DEBUG', 'false').lower() == 'true',
+        OLLAMA_BASE_URL=os.getenv('OLLAMA_BASE_URL', WarpConfig.OLLAMA_BASE_URL),
+        OLLAMA_MODEL=os.getenv('OLLAMA_MODEL', WarpConfig.OLLAMA_MODEL),
+        SOCKETIO_MESSAGE_QUEUE=os.getenv('SOCKETIO_MESSAGE_QUEUE',
+                                         WarpConfig.SOCKETIO_MESSAGE_QUEUE)
+    )
+
+    # Create directories if they don't exist
+    _ensure_dir(config.DATA_DIR)
+    _ensure_dir(config.SIMULATION_DIR)
+    _ensure_dir(config.KNOWLEDGE_DIR)
+
+    return config
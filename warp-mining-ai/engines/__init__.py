@@ -3,14 +3,21 @@ Warp Mining AI Engines Package
 Specialized engines for mining operations simulation and optimization
 """
 
-from .chat_assistant import MiningChatAssistant
-from .extraction_simulator import ExtractionSimulator
-from .exploration_simulator import ExplorationSimulator
-from .optimization_engine import OptimizationEngine
+import importlib
+
+# Engine classes are resolved lazily (PEP 562) so importing the package does
+# not pull in the heavy simulation dependencies (numpy, pandas) until the
+# corresponding engine is actually used.
+_LAZY_ENGINES = {
+    'MiningChatAssistant': '.chat_assistant',
+    'ExtractionSimulator': '.extraction_simulator',
+    'ExplorationSimulator': '.exploration_simulator',
+    'OptimizationEngine': '.optimization_engine'
+}
 
 __all__ = [
     'MiningChatAssistant',
-    'ExtractionSimulator', 
+    'ExtractionSimulator',
     'ExplorationSimulator',
     'OptimizationEngine'
 ]
@@ -18,3 +25,15 @@ __all__ = [
 __version__ = '1.0.0'
 __author__ = 'Warp Mining AI Team'
 __description__ = 'Advanced mining intelligence engines for copper and cobalt operations'
+
+def __getattr__(name):
+    """Import an engine module on first attribute access"""
+    if name in _LAZY_ENGINES:
+        module = importlib.import_module(_LAZY_ENGINES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -4,11 +4,18 @@ Warp Mining AI Assistant - Main Application
 Self-contained AI system for copper and cobalt mining operations
 """
 
+import gzip
+import hashlib
 import os
 import json
 import logging
+import re
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime
-from flask import Flask, request, jsonify, render_template_string
+import orjson
+from flask import Flask, request, Response
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 
@@ -16,7 +23,7 @@ from engines.chat_assistant import MiningChatAssistant
 from engines.extraction_simulator import ExtractionSimulator
 from engines.exploration_simulator import ExplorationSimulator
 from engines.optimization_engine import OptimizationEngine
-from config import WarpConfig
+from config import get_config
 
 # Configure logging
 logging.basicConfig(
@@ -25,16 +32,142 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Routing keywords compiled into single alternations with one named group
+# per category; a single scan of the lowercased input yields every
+# matching category instead of one substring sweep per keyword list
+_ROUTE_RE = re.compile(
+    '|'.join(
+        f'(?P<{name}>{pattern})' for name, pattern in (
+            ('sim', r'simulate|simulation|predict|model'),
+            ('extraction', r'extract|leach|electrowin|refin'),
+            ('exploration', r'explor|prospect|deposit|geological'),
+            ('optimize', r'optimize|improve|better|efficiency')
+        )
+    )
+)
+
+_OBJECTIVE_RE = re.compile(
+    '|'.join(
+        f'(?P<{name}>{pattern})' for name, pattern in (
+            ('minimize_cost', r'cost|cheap|economic'),
+            ('minimize_time', r'time|fast|quick'),
+            ('maximize_purity', r'purity|quality|grade')
+        )
+    )
+)
+_OBJECTIVE_ORDER = ('minimize_cost', 'minimize_time', 'maximize_purity')
+
+# Numeric literals in user input ("2.5% ore grade", "65C", ...)
+_NUM_RE = re.compile(r'\d+(?:\.\d+)?')
+
+def _iter_chunks(text, size=512):
+    """Split a response into line-aligned chunks of roughly `size` chars"""
+    if len(text) <= size:
+        yield text
+        return
+    buffer = []
+    length = 0
+    for line in text.splitlines(keepends=True):
+        buffer.append(line)
+        length += len(line)
+        if length >= size:
+            yield ''.join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield ''.join(buffer)
+
+# One-slot memo so the ISO timestamp string is formatted at most once
+# per millisecond instead of on every request
+_ts_cache = [0, '']
+
+def _iso_now():
+    """Current local time in ISO format, cached per millisecond"""
+    ms = time.time_ns() // 1_000_000
+    if ms != _ts_cache[0]:
+        _ts_cache[0] = ms
+        _ts_cache[1] = datetime.now().isoformat()
+    return _ts_cache[1]
+
+def fast_jsonify(payload, status=200):
+    """Serialize an API payload with orjson (NumPy scalars included)"""
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
+class ConversationStore:
+    """In-memory conversation store with response-ID chaining.
+
+    Every recorded turn gets a response id; clients may send
+    previous_response_id with their next message and the server rebuilds
+    the thread by walking the chain. Retention is bounded, so per-process
+    memory stays O(max_entries) regardless of chat volume. The interface
+    is kept narrow (record / walk / recent) so a shared backend such as
+    Redis can replace this one for multi-worker deployments without
+    touching the handlers.
+    """
+
+    def __init__(self, max_entries=1024):
+        self._entries = OrderedDict()
+        self._max_entries = max_entries
+
+    def record(self, user, assistant, previous_response_id=None):
+        """Store one conversation turn and return its response id"""
+        response_id = uuid.uuid4().hex
+        self._entries[response_id] = {
+            'user': user,
+            'assistant': assistant,
+            'previous_response_id': previous_response_id,
+            'timestamp': time.time()
+        }
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return response_id
+
+    def walk(self, response_id, max_turns=20):
+        """Rebuild a conversation by following the id chain, oldest first"""
+        turns = []
+        while response_id and len(turns) < max_turns:
+            entry = self._entries.get(response_id)
+            if entry is None:
+                break
+            turns.append(entry)
+            response_id = entry['previous_response_id']
+        turns.reverse()
+        return turns
+
+    def recent(self, limit=50):
+        """Return the most recently recorded turns in insertion order"""
+        if limit <= 0:
+            return []
+        entries = list(self._entries.values())
+        return entries[-limit:] if limit < len(entries) else entries
+
+    def __len__(self):
+        return len(self._entries)
+
 class WarpMiningAI:
     """Main Warp Mining AI Assistant System"""
     
     def __init__(self):
-        self.config = WarpConfig()
+        self.config = get_config()
         self.app = Flask(__name__)
         self.app.config['SECRET_KEY'] = 'warp-mining-ai-2024'
         
         CORS(self.app)
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        # Compress SocketIO payloads above ~half a KB; chat responses are
+        # markdown-heavy text that gzips well, smaller frames go as-is.
+        # A message queue URL (SOCKETIO_MESSAGE_QUEUE env var) lets events
+        # reach clients on other gunicorn workers when running with -w N.
+        self.socketio = SocketIO(
+            self.app,
+            cors_allowed_origins="*",
+            http_compression=True,
+            compression_threshold=512,
+            message_queue=self.config.SOCKETIO_MESSAGE_QUEUE or None
+        )
         
         # Initialize engines
         self.chat_assistant = MiningChatAssistant()
@@ -42,26 +175,70 @@ class WarpMiningAI:
         self.exploration_simulator = ExplorationSimulator()
         self.optimization_engine = OptimizationEngine()
         
-        # Conversation history
-        self.conversation_history = []
+        # The index page has no template variables; render and
+        # fingerprint it once so '/' never touches Jinja at request time
+        self._index_html = self.get_main_template()
+        self._index_etag = hashlib.md5(self._index_html.encode()).hexdigest()
+        self._index_gzip = gzip.compress(self._index_html.encode(), 9)
+
+        # Conversation history, bounded and chained by response id
+        self.conversations = ConversationStore(max_entries=self.config.HISTORY_MAX)
+
+        # LRU cache of responses keyed on the normalized prompt, so
+        # repeated questions short-circuit before engine dispatch
+        self._response_cache = OrderedDict()
         
         self.setup_routes()
         self.setup_socket_events()
-        
+
+        if self.config.WARMUP:
+            self._warmup()
+
         logger.info("Warp Mining AI Assistant initialized successfully")
-    
+
+    def _warmup(self):
+        """Run one small pass of each engine so caches are hot before traffic.
+
+        The first real request otherwise pays all the cold-start costs at
+        once: lru_cache population, NumPy internal buffer allocation and the
+        chat assistant's knowledge lookups. A warmup failure is logged but
+        never blocks startup.
+        """
+        started = time.perf_counter()
+        try:
+            self.extraction_simulator.simulate(self.parse_extraction_parameters('copper'))
+            self.exploration_simulator.simulate(
+                {**self.parse_exploration_parameters('copper'), 'fast_path': True})
+            self.optimization_engine.optimize(
+                self.parse_optimization_parameters(''), 'maximize_efficiency')
+            self.chat_assistant.respond('How do I extract copper from oxide ore?')
+        except Exception:
+            logger.exception("Engine warmup failed")
+        else:
+            logger.info("Engine warmup completed in %.2fs", time.perf_counter() - started)
+
     def setup_routes(self):
         """Setup Flask routes"""
         
         @self.app.route('/')
         def index():
-            return render_template_string(self.get_main_template())
+            if request.headers.get('If-None-Match') == self._index_etag:
+                return Response(status=304)
+            headers = {
+                'ETag': self._index_etag,
+                'Cache-Control': 'public, max-age=3600',
+                'Vary': 'Accept-Encoding'
+            }
+            if 'gzip' in request.headers.get('Accept-Encoding', ''):
+                headers['Content-Encoding'] = 'gzip'
+                return Response(self._index_gzip, mimetype='text/html', headers=headers)
+            return Response(self._index_html, mimetype='text/html', headers=headers)
         
         @self.app.route('/health')
         def health():
-            return jsonify({
+            return fast_jsonify({
                 'status': 'healthy',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _iso_now(),
                 'engines': {
                     'chat_assistant': True,
                     'extraction_simulator': True,
@@ -74,25 +251,25 @@ class WarpMiningAI:
         def chat():
             data = request.get_json()
             user_input = data.get('message', '')
-            
+            previous_response_id = data.get('previous_response_id')
+
             if not user_input:
-                return jsonify({'error': 'No message provided'}), 400
-            
+                return fast_jsonify({'error': 'No message provided'}, 400)
+
             try:
                 response = self.process_user_input(user_input)
-                self.conversation_history.append({
-                    'user': user_input,
-                    'assistant': response,
-                    'timestamp': datetime.now().isoformat()
-                })
-                
-                return jsonify({
+                response_id = self.conversations.record(
+                    user_input, response, previous_response_id
+                )
+
+                return fast_jsonify({
                     'response': response,
-                    'timestamp': datetime.now().isoformat()
+                    'response_id': response_id,
+                    'timestamp': _iso_now()
                 })
             except Exception as e:
                 logger.error(f"Error processing chat: {str(e)}")
-                return jsonify({'error': str(e)}), 500
+                return fast_jsonify({'error': str(e)}, 500)
         
         @self.app.route('/api/simulate', methods=['POST'])
         def simulate():
@@ -106,12 +283,12 @@ class WarpMiningAI:
                 elif simulation_type == 'exploration':
                     result = self.exploration_simulator.simulate(parameters)
                 else:
-                    return jsonify({'error': 'Invalid simulation type'}), 400
+                    return fast_jsonify({'error': 'Invalid simulation type'}, 400)
                 
-                return jsonify(result)
+                return fast_jsonify(result)
             except Exception as e:
                 logger.error(f"Error in simulation: {str(e)}")
-                return jsonify({'error': str(e)}), 500
+                return fast_jsonify({'error': str(e)}, 500)
         
         @self.app.route('/api/optimize', methods=['POST'])
         def optimize():
@@ -121,10 +298,15 @@ class WarpMiningAI:
             
             try:
                 result = self.optimization_engine.optimize(parameters, objective)
-                return jsonify(result)
+                return fast_jsonify(result)
             except Exception as e:
                 logger.error(f"Error in optimization: {str(e)}")
-                return jsonify({'error': str(e)}), 500
+                return fast_jsonify({'error': str(e)}, 500)
+
+        @self.app.route('/api/history')
+        def history():
+            limit = request.args.get('limit', 50, type=int)
+            return fast_jsonify({'history': self.conversations.recent(max(0, limit))})
     
     def setup_socket_events(self):
         """Setup SocketIO events for real-time communication"""
@@ -143,27 +325,58 @@ class WarpMiningAI:
             user_input = data.get('message', '')
             if user_input:
                 response = self.process_user_input(user_input)
-                emit('chat_response', {
-                    'response': response,
-                    'timestamp': datetime.now().isoformat()
-                })
+                if response is None:
+                    # A simulate keyword with no recognizable subtype routes
+                    # nowhere; answer with the general assistant instead of
+                    # crashing the stream before chat_done
+                    response = self.chat_assistant.respond(user_input)
+                # Stream section-sized chunks so the client renders the
+                # long simulation responses progressively
+                for chunk in _iter_chunks(response):
+                    emit('chat_chunk', {'text': chunk})
+                emit('chat_done', {'timestamp': _iso_now()})
     
+    # Maximum distinct prompts retained in the response cache
+    _RESPONSE_CACHE_SIZE = 1024
+
     def process_user_input(self, user_input):
         """Process user input and route to appropriate engine"""
-        
+
         user_input_lower = user_input.lower()
-        
+
+        # Exact-match cache first: identical (modulo whitespace/case)
+        # prompts skip the engine path entirely
+        cache_key = ' '.join(user_input_lower.split())
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return cached
+
+        response = self._dispatch_user_input(user_input, user_input_lower)
+
+        if response is not None:
+            self._response_cache[cache_key] = response
+            if len(self._response_cache) > self._RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+        return response
+
+    def _dispatch_user_input(self, user_input, user_input_lower):
+        """Route user input to the engine that should answer it"""
+
+        tags = {match.lastgroup for match in _ROUTE_RE.finditer(user_input_lower)}
+
         # Check for simulation requests
-        if any(word in user_input_lower for word in ['simulate', 'simulation', 'predict', 'model']):
-            if any(word in user_input_lower for word in ['extract', 'leach', 'electrowin', 'refin']):
+        if 'sim' in tags:
+            if 'extraction' in tags:
                 return self.handle_extraction_simulation(user_input)
-            elif any(word in user_input_lower for word in ['explor', 'prospect', 'deposit', 'geological']):
+            elif 'exploration' in tags:
                 return self.handle_exploration_simulation(user_input)
-        
+
         # Check for optimization requests
-        elif any(word in user_input_lower for word in ['optimize', 'improve', 'better', 'efficiency']):
+        elif 'optimize' in tags:
             return self.handle_optimization(user_input)
-        
+
         # Default to chat assistant
         else:
             return self.chat_assistant.respond(user_input)
@@ -172,68 +385,69 @@ class WarpMiningAI:
         """Handle extraction simulation requests"""
         # Parse parameters from user input (simplified)
         parameters = self.parse_extraction_parameters(user_input)
-        
+
         # Run simulation
         result = self.extraction_simulator.simulate(parameters)
-        
-        # Format response
-        response = f"🔬 **Extraction Simulation Complete**\\n\\n"
-        response += f"**Model Used:** {result['model_type']}\\n"
-        response += f"**Parameters:**\\n"
-        for key, value in result['parameters'].items():
-            response += f"  • {key}: {value}\\n"
-        response += f"\\n**Results:**\\n"
-        for key, value in result['results'].items():
-            response += f"  • {key}: {value}\\n"
-        
+
+        # Format response: collect parts and join once, linear in output size
+        parts = [
+            "🔬 **Extraction Simulation Complete**\n\n",
+            f"**Model Used:** {result['model_type']}\n",
+            "**Parameters:**\n"
+        ]
+        parts.extend(f"  • {key}: {value}\n" for key, value in result['parameters'].items())
+        parts.append("\n**Results:**\n")
+        parts.extend(f"  • {key}: {value}\n" for key, value in result['results'].items())
+
         if result.get('recommendations'):
-            response += f"\\n**💡 Recommendations:**\\n"
-            for rec in result['recommendations']:
-                response += f"  • {rec}\\n"
-        
-        return response
-    
+            parts.append("\n**💡 Recommendations:**\n")
+            parts.extend(f"  • {rec}\n" for rec in result['recommendations'])
+
+        return "".join(parts)
+
     def handle_exploration_simulation(self, user_input):
         """Handle exploration simulation requests"""
         parameters = self.parse_exploration_parameters(user_input)
         result = self.exploration_simulator.simulate(parameters)
-        
-        response = f"🗺️ **Exploration Simulation Complete**\\n\\n"
-        response += f"**Model Used:** {result['model_type']}\\n"
-        response += f"**Analysis:** {result['analysis']}\\n"
-        response += f"\\n**Prospectivity Results:**\\n"
-        for location, probability in result['prospectivity'].items():
-            response += f"  • {location}: {probability:.1f}% likelihood\\n"
-        
+
+        parts = [
+            "🗺️ **Exploration Simulation Complete**\n\n",
+            f"**Model Used:** {result['model_type']}\n",
+            f"**Analysis:** {result['analysis']}\n",
+            "\n**Prospectivity Results:**\n"
+        ]
+        parts.extend(f"  • {location}: {probability:.1f}% likelihood\n"
+                     for location, probability in result['prospectivity'].items())
+
         if result.get('recommendations'):
-            response += f"\\n**💡 Recommendations:**\\n"
-            for rec in result['recommendations']:
-                response += f"  • {rec}\\n"
-        
-        return response
-    
+            parts.append("\n**💡 Recommendations:**\n")
+            parts.extend(f"  • {rec}\n" for rec in result['recommendations'])
+
+        return "".join(parts)
+
     def handle_optimization(self, user_input):
         """Handle optimization requests"""
         parameters = self.parse_optimization_parameters(user_input)
         objective = self.extract_objective(user_input)
-        
+
         result = self.optimization_engine.optimize(parameters, objective)
-        
-        response = f"⚡ **Optimization Complete**\\n\\n"
-        response += f"**Objective:** {result['objective']}\\n"
-        response += f"**Algorithm:** {result['algorithm']}\\n"
-        response += f"\\n**Optimized Parameters:**\\n"
-        for param, value in result['optimized_parameters'].items():
-            response += f"  • {param}: {value}\\n"
-        
-        response += f"\\n**Expected Improvement:** {result['improvement']}\\n"
-        
+
+        parts = [
+            "⚡ **Optimization Complete**\n\n",
+            f"**Objective:** {result['objective']}\n",
+            f"**Algorithm:** {result['algorithm']}\n",
+            "\n**Optimized Parameters:**\n"
+        ]
+        parts.extend(f"  • {param}: {value}\n"
+                     for param, value in result['optimized_parameters'].items())
+
+        parts.append(f"\n**Expected Improvement:** {result['improvement']}\n")
+
         if result.get('recommendations'):
-            response += f"\\n**💡 Next Steps:**\\n"
-            for rec in result['recommendations']:
-                response += f"  • {rec}\\n"
-        
-        return response
+            parts.append("\n**💡 Next Steps:**\n")
+            parts.extend(f"  • {rec}\n" for rec in result['recommendations'])
+
+        return "".join(parts)
     
     def parse_extraction_parameters(self, user_input):
         """Extract parameters from user input for extraction simulation"""
@@ -252,9 +466,8 @@ class WarpMiningAI:
             defaults['mineral_type'] = 'cobalt_sulfide'
         
         # Extract numbers and associate with likely parameters
-        import re
-        numbers = re.findall(r'\\d+\\.?\\d*', user_input)
-        
+        numbers = _NUM_RE.findall(user_input)
+
         return defaults
     
     def parse_exploration_parameters(self, user_input):
@@ -277,14 +490,11 @@ class WarpMiningAI:
     
     def extract_objective(self, user_input):
         """Extract optimization objective from user input"""
-        if any(word in user_input.lower() for word in ['cost', 'cheap', 'economic']):
-            return 'minimize_cost'
-        elif any(word in user_input.lower() for word in ['time', 'fast', 'quick']):
-            return 'minimize_time'
-        elif any(word in user_input.lower() for word in ['purity', 'quality', 'grade']):
-            return 'maximize_purity'
-        else:
-            return 'maximize_efficiency'
+        tags = {match.lastgroup for match in _OBJECTIVE_RE.finditer(user_input.lower())}
+        for objective in _OBJECTIVE_ORDER:
+            if objective in tags:
+                return objective
+        return 'maximize_efficiency'
     
     def get_main_template(self):
         """Return the main HTML template"""
@@ -488,7 +698,26 @@ class WarpMiningAI:
                 socket.on('chat_response', function(data) {
                     addMessage('assistant', data.response);
                 });
-                
+
+                let streamingDiv = null;
+                let streamingText = '';
+
+                socket.on('chat_chunk', function(data) {
+                    if (!streamingDiv) {
+                        streamingDiv = addMessage('assistant', '');
+                        streamingText = '';
+                    }
+                    streamingText += data.text;
+                    streamingDiv.innerHTML = formatMessage(streamingText);
+                    const chatMessages = document.getElementById('chatMessages');
+                    chatMessages.scrollTop = chatMessages.scrollHeight;
+                });
+
+                socket.on('chat_done', function(data) {
+                    streamingDiv = null;
+                    streamingText = '';
+                });
+
                 socket.on('status', function(data) {
                     document.getElementById('status').textContent = data.message;
                 });
@@ -504,20 +733,22 @@ class WarpMiningAI:
                     }
                 }
                 
+                // Convert markdown-style formatting to HTML
+                function formatMessage(text) {
+                    return text
+                        .replace(/\\*\\*(.*?)\\*\\*/g, '<strong>$1</strong>')
+                        .replace(/\\*(.*?)\\*/g, '<em>$1</em>')
+                        .replace(/\\n/g, '<br>');
+                }
+
                 function addMessage(sender, text) {
                     const chatMessages = document.getElementById('chatMessages');
                     const messageDiv = document.createElement('div');
                     messageDiv.className = `message ${sender}-message`;
-                    
-                    // Convert markdown-style formatting to HTML
-                    const formattedText = text
-                        .replace(/\\*\\*(.*?)\\*\\*/g, '<strong>$1</strong>')
-                        .replace(/\\*(.*?)\\*/g, '<em>$1</em>')
-                        .replace(/\\n/g, '<br>');
-                    
-                    messageDiv.innerHTML = formattedText;
+                    messageDiv.innerHTML = formatMessage(text);
                     chatMessages.appendChild(messageDiv);
                     chatMessages.scrollTop = chatMessages.scrollHeight;
+                    return messageDiv;
                 }
                 
                 // Enter key support
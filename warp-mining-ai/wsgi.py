@@ -0,0 +1,19 @@
+"""
+WSGI entrypoint for production servers.
+
+The Werkzeug dev server started by `python main.py` serializes every
+request on one thread; in production run the app under gunicorn with an
+eventlet worker so Flask-SocketIO websockets keep working:
+
+    gunicorn -k eventlet -w 1 -b 0.0.0.0:8888 wsgi:application
+
+Scaling past one worker additionally requires a shared SocketIO message
+queue so events reach clients connected to other workers: set the
+SOCKETIO_MESSAGE_QUEUE env var (e.g. 'redis://redis:6379/0') before
+raising -w.
+"""
+
+from main import WarpMiningAI
+
+warp = WarpMiningAI()
+application = warp.app